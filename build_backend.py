@@ -0,0 +1,18 @@
+"""
+Build backend for this checkout: setuptools, restricted to editable installs
+
+src and config are installed under their generic top-level names and
+Settings.BASE_DIR locates data/ relative to the checkout, so a wheel (or a
+plain `pip install .`) would drop clashing, broken packages into
+site-packages. Wheel builds are refused; `pip install -e .` goes through
+build_editable and is unaffected.
+"""
+
+from setuptools.build_meta import *  # noqa: F401,F403
+
+
+def build_wheel(wheel_directory, config_settings=None, metadata_directory=None):
+    raise RuntimeError(
+        "twitter-data-intelligence only supports editable installs: "
+        "pip install -e ."
+    )
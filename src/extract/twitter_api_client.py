@@ -3,12 +3,20 @@ Twitter API Client for extracting tweet data
 Handles authentication, rate limiting, and data extraction
 """
 
+import asyncio
+import itertools
 import os
+import json
 import logging
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Union
 from datetime import datetime
+from operator import itemgetter
+from types import MappingProxyType
+import threading
 import time
 import random
+import numpy as np
 from faker import Faker
 
 # Try to import tweepy, but provide mock if not available
@@ -19,6 +27,13 @@ except ImportError:
     TWEEP_AVAILABLE = False
     logging.warning("tweepy not available, using mock data")
 
+# orjson is optional; it serializes datetimes natively and much faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Try to import dotenv
 try:
     from dotenv import load_dotenv
@@ -28,10 +43,133 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Environment variables holding the Twitter API credentials
+CREDENTIAL_ENV_VARS = (
+    "TWITTER_API_KEY",
+    "TWITTER_API_SECRET",
+    "TWITTER_ACCESS_TOKEN",
+    "TWITTER_ACCESS_TOKEN_SECRET",
+)
+
+# Field extractors for tweet entities
+_hashtag_text = itemgetter("text")
+_mention_name = itemgetter("screen_name")
+_expanded_url = itemgetter("expanded_url")
+
+# Faker seeds all of its providers on construction, so build it once
+_FAKE = Faker()
+
+# Pre-rendered mock tweets that _get_mock_tweets samples from
+MOCK_POOL_SIZE = 10_000
+_MOCK_POOL: List[Dict[str, Any]] = []
+_MOCK_POOL_LOCK = threading.Lock()
+
+# Every mock tweet handed out gets the next id from here. The random start
+# keeps ids from separate runs apart, so re-running a pipeline against the
+# same database still stores new tweets
+_MOCK_TWEET_IDS = itertools.count(random.randrange(1 << 62))
+
+# Searches AsyncTwitterClient keeps in flight at once; the search endpoint
+# is rate limited per 15-minute window, so more buys little
+MAX_CONCURRENT_SEARCHES = 4
+
+# Tweet fields stored as contiguous int64 arrays in a TweetBatch
+NUMERIC_FIELDS = (
+    "user_followers",
+    "user_following",
+    "retweet_count",
+    "favorite_count",
+    "reply_count",
+)
+
+
+@dataclass
+class TweetBatch:
+    """
+    Column-oriented view of a batch of tweets
+
+    Numeric fields are NumPy int64 arrays so they can be filtered and
+    aggregated without touching each tweet; every other field is a list.
+    """
+    columns: Dict[str, Any] = field(default_factory=dict)
+    size: int = 0
+    
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "TweetBatch":
+        """Build a batch from tweet dictionaries in a single pass"""
+        records = list(records)
+        size = len(records)
+        keys = list(dict.fromkeys(key for record in records for key in record))
+        
+        columns = {
+            key: np.empty(size, dtype=np.int64) if key in NUMERIC_FIELDS else []
+            for key in keys
+        }
+        for i, record in enumerate(records):
+            for key in keys:
+                value = record.get(key)
+                if key in NUMERIC_FIELDS:
+                    columns[key][i] = value or 0
+                else:
+                    columns[key].append(value)
+        
+        return cls(columns=columns, size=size)
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Convert back to the list-of-dicts format used by the pipeline"""
+        keys = list(self.columns)
+        values = [
+            column.tolist() if isinstance(column, np.ndarray) else column
+            for column in self.columns.values()
+        ]
+        return [dict(zip(keys, row)) for row in zip(*values)]
+    
+    def to_dataframe(self):
+        """Convert to a pandas DataFrame"""
+        import pandas as pd
+        return pd.DataFrame(self.columns)
+    
+    def length_mask(self, min_length: int, max_length: int) -> np.ndarray:
+        """Boolean mask of tweets whose text length is within bounds"""
+        lengths = np.fromiter(
+            (len(text or "") for text in self.columns.get("text", [None] * self.size)),
+            dtype=np.int64,
+            count=self.size,
+        )
+        return (lengths >= min_length) & (lengths <= max_length)
+
 
 class TwitterAPIClient:
     """Client for interacting with Twitter API"""
     
+    # Seconds a fetched rate-limit status is reused by test_connection
+    RATE_LIMIT_TTL = 15
+    
+    # Vocabulary for mock tweets
+    MOCK_BRANDS = ("Tesla", "Netflix", "Starbucks", "Apple", "Google")
+    MOCK_SENTIMENTS = ("positive", "negative", "neutral")
+    MOCK_SOURCES = ("Twitter Web App", "Twitter for iPhone", "TweetDeck")
+    MOCK_TEXTS = {
+        "positive": (
+            "Loving my new {brand} product! Amazing experience!",
+            "{brand} is changing the game! So impressed!",
+            "Best service from {brand} ever! Highly recommend!"
+        ),
+        "negative": (
+            "Really disappointed with {brand}. Terrible experience.",
+            "{brand} customer service is awful. Never again!",
+            "Worst purchase ever from {brand}. Stay away!"
+        ),
+        "neutral": (
+            "Just bought a {brand} product. We'll see how it goes.",
+            "Reading about {brand}'s new features. Interesting.",
+            "Saw {brand} mentioned in the news today."
+        ),
+    }
+    
     def __init__(self, use_mock: bool = False):
         """
         Initialize Twitter API client
@@ -41,6 +179,9 @@ class TwitterAPIClient:
                      (Useful for development and testing)
         """
         self.use_mock = use_mock or not TWEEP_AVAILABLE
+        self._fake = _FAKE
+        self._search_defaults = MappingProxyType({"lang": "en", "tweet_mode": "extended"})
+        self._rate_limit_cache = None  # (fetched_at, limits)
         
         if not self.use_mock:
             self._setup_api_client()
@@ -50,13 +191,31 @@ class TwitterAPIClient:
     def _setup_api_client(self) -> None:
         """Set up Twitter API authentication"""
         try:
-            # Get credentials from environment variables
-            api_key = os.getenv("TWITTER_API_KEY")
-            api_secret = os.getenv("TWITTER_API_SECRET")
-            access_token = os.getenv("TWITTER_ACCESS_TOKEN")
-            access_secret = os.getenv("TWITTER_ACCESS_SECRET")
+            # Reuse the credentials already read by the settings singleton,
+            # falling back to one pass over the environment
+            try:
+                from config.settings import get_settings
+                settings = get_settings()
+            except ImportError:
+                credentials = tuple(map(os.environ.get, CREDENTIAL_ENV_VARS))
+            except Exception as e:
+                # Settings exist but failed to load (e.g. an unsupported
+                # DATABASE_TYPE); that is no reason to drop to mock data
+                logger.warning(
+                    "Could not load settings (%s); reading Twitter credentials "
+                    "from the environment", e
+                )
+                credentials = tuple(map(os.environ.get, CREDENTIAL_ENV_VARS))
+            else:
+                credentials = (
+                    settings.TWITTER_API_KEY,
+                    settings.TWITTER_API_SECRET,
+                    settings.TWITTER_ACCESS_TOKEN,
+                    settings.TWITTER_ACCESS_TOKEN_SECRET,
+                )
             
-            if not all([api_key, api_secret, access_token, access_secret]):
+            api_key, api_secret, access_token, access_secret = credentials
+            if not all(credentials):
                 logger.warning("Twitter API credentials not found. Using mock data.")
                 self.use_mock = True
                 return
@@ -75,13 +234,14 @@ class TwitterAPIClient:
             logger.info("Twitter API client initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize Twitter API: {e}")
+            logger.error("Failed to initialize Twitter API: %s", e)
             self.use_mock = True
     
     def search_tweets(
         self, 
         query: str, 
         count: int = 100,
+        *,
         since: Optional[str] = None,
         until: Optional[str] = None,
         lang: str = "en"
@@ -91,7 +251,7 @@ class TwitterAPIClient:
         
         Args:
             query: Search query string
-            count: Number of tweets to return (max 100 per request)
+            count: Number of tweets to return (fetched in pages of up to 100)
             since: Start date (YYYY-MM-DD)
             until: End date (YYYY-MM-DD)
             lang: Language code
@@ -103,37 +263,77 @@ class TwitterAPIClient:
             return self._get_mock_tweets(count)
         
         try:
-            tweets = []
-            
-            # Build search parameters
-            search_args = {
-                "q": query,
-                "count": min(count, 100),  # Twitter limit
-                "lang": lang,
-                "tweet_mode": "extended"
-            }
-            
-            if since:
-                search_args["since"] = since
-            if until:
-                search_args["until"] = until
+            search_args = self._search_args(query, count, since, until, lang)
             
-            # Make API call
-            logger.info(f"Searching Twitter for: {query}")
-            search_results = self.api.search_tweets(**search_args)
+            # Make API calls, following max_id pagination until count is reached
+            logger.info("Searching Twitter for: %s", query)
+            search_results = tweepy.Cursor(self.api.search_tweets, **search_args).items(count)
             
-            # Convert to dictionary format
-            for tweet in search_results:
-                tweet_dict = self._tweet_to_dict(tweet)
-                tweets.append(tweet_dict)
+            # Convert to dictionary format (one collection timestamp per batch)
+            now = datetime.now()
+            convert = self._tweet_to_dict
+            tweets = [convert(tweet, now) for tweet in search_results]
             
-            logger.info(f"Found {len(tweets)} tweets for query: {query}")
+            logger.info("Found %d tweets for query: %s", len(tweets), query)
             return tweets
             
         except Exception as e:
-            logger.error(f"Error searching tweets: {e}")
+            logger.error("Error searching tweets: %s", e)
             return []
     
+    def search_tweets_iter(
+        self, 
+        query: str, 
+        count: int = 100,
+        *,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        lang: str = "en"
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Search for tweets matching a query, yielding them one at a time
+        
+        Takes the same arguments as search_tweets, but converts each tweet as
+        tweepy pages it in instead of collecting the whole result first.
+        """
+        if self.use_mock:
+            yield from self._get_mock_tweets(count)
+            return
+        
+        try:
+            search_args = self._search_args(query, count, since, until, lang)
+            logger.info("Streaming Twitter search for: %s", query)
+            
+            now = datetime.now()
+            convert = self._tweet_to_dict
+            for tweet in tweepy.Cursor(self.api.search_tweets, **search_args).items(count):
+                yield convert(tweet, now)
+                
+        except Exception as e:
+            logger.error("Error searching tweets: %s", e)
+    
+    def _search_args(
+        self,
+        query: str,
+        count: int,
+        since: Optional[str],
+        until: Optional[str],
+        lang: str
+    ) -> Dict[str, Any]:
+        """Build search parameters from the client-wide defaults"""
+        search_args = {
+            **self._search_defaults,
+            "q": query,
+            "count": min(count, 100),  # Twitter page size limit
+            "lang": lang
+        }
+        
+        if since:
+            search_args["since"] = since
+        if until:
+            search_args["until"] = until
+        return search_args
+    
     def get_user_tweets(
         self, 
         username: str, 
@@ -144,104 +344,157 @@ class TwitterAPIClient:
             return self._get_mock_tweets(count, username=username)
         
         try:
-            tweets = []
-            user_tweets = self.api.user_timeline(
+            user_tweets = tweepy.Cursor(
+                self.api.user_timeline,
                 screen_name=username,
-                count=count,
+                count=min(count, 200),  # Twitter page size limit
                 tweet_mode="extended"
-            )
-            
-            for tweet in user_tweets:
-                tweet_dict = self._tweet_to_dict(tweet)
-                tweets.append(tweet_dict)
+            ).items(count)
             
-            return tweets
+            now = datetime.now()
+            convert = self._tweet_to_dict
+            return [convert(tweet, now) for tweet in user_tweets]
             
         except Exception as e:
-            logger.error(f"Error getting user tweets: {e}")
+            logger.error("Error getting user tweets: %s", e)
             return []
     
-    def _tweet_to_dict(self, tweet) -> Dict[str, Any]:
-        """Convert tweepy Tweet object to dictionary"""
+    def search_tweets_batch(self, query: str, **kwargs) -> TweetBatch:
+        """Search for tweets and return them as a column-oriented TweetBatch"""
+        return TweetBatch.from_records(self.search_tweets(query, **kwargs))
+    
+    def _tweet_to_dict(self, tweet, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Convert tweepy Tweet object to dictionary
+        
+        Args:
+            tweet: tweepy Status object
+            now: Collection timestamp shared by the whole batch
+                 (defaults to the current time)
+        """
+        now = now or datetime.now()
+        # Resolve nested objects once instead of once per field
+        user = tweet.user
+        entities = tweet.entities
         return {
             "tweet_id": str(tweet.id),
             "created_at": tweet.created_at,
             "text": tweet.full_text,
-            "user_id": str(tweet.user.id),
-            "user_name": tweet.user.screen_name,
-            "user_display_name": tweet.user.name,
-            "user_followers": tweet.user.followers_count,
-            "user_following": tweet.user.friends_count,
+            "user_id": str(user.id),
+            "user_name": user.screen_name,
+            "user_display_name": user.name,
+            "user_followers": user.followers_count,
+            "user_following": user.friends_count,
             "retweet_count": tweet.retweet_count,
             "favorite_count": tweet.favorite_count,
-            "reply_count": tweet.reply_count if hasattr(tweet, 'reply_count') else 0,
+            "reply_count": getattr(tweet, 'reply_count', 0),
             "is_retweet": hasattr(tweet, 'retweeted_status'),
-            "hashtags": [hashtag["text"] for hashtag in tweet.entities.get("hashtags", [])],
-            "mentions": [mention["screen_name"] for mention in tweet.entities.get("user_mentions", [])],
-            "urls": [url["expanded_url"] for url in tweet.entities.get("urls", [])],
-            "language": tweet.lang if hasattr(tweet, 'lang') else "en",
+            "hashtags": list(map(_hashtag_text, entities.get("hashtags", ()))),
+            "mentions": list(map(_mention_name, entities.get("user_mentions", ()))),
+            "urls": list(map(_expanded_url, entities.get("urls", ()))),
+            "language": getattr(tweet, 'lang', "en"),
             "source": tweet.source,
-            "collected_at": datetime.now()
+            "collected_at": now
         }
     
     def _get_mock_tweets(self, count: int = 10, username: str = None) -> List[Dict[str, Any]]:
+        """Sample mock tweet data for development from a pre-rendered pool"""
+        if count > MOCK_POOL_SIZE:
+            tweets = self._generate_mock_tweets(count, username=username)
+            for tweet in tweets:
+                tweet["tweet_id"] = f"mock_{next(_MOCK_TWEET_IDS)}"
+            return tweets
+        
+        # Fill the pool from freshly generated batches until it is full,
+        # then only sample from it
+        with _MOCK_POOL_LOCK:
+            if len(_MOCK_POOL) < MOCK_POOL_SIZE:
+                sampled = self._generate_mock_tweets(count)
+                _MOCK_POOL.extend(sampled[:MOCK_POOL_SIZE - len(_MOCK_POOL)])
+            else:
+                sampled = random.sample(_MOCK_POOL, count)
+        
+        overrides = {"collected_at": datetime.now()}
+        if username:
+            overrides["user_name"] = username
+        
+        # Copy the list fields so callers can't mutate the shared pool, and
+        # give each copy its own tweet_id (pooled tweets are handed out
+        # again and again)
+        return [
+            dict(tweet, hashtags=list(tweet["hashtags"]), mentions=list(tweet["mentions"]),
+                 urls=list(tweet["urls"]), tweet_id=f"mock_{next(_MOCK_TWEET_IDS)}",
+                 **overrides)
+            for tweet in sampled
+        ]
+    
+    def _generate_mock_tweets(self, count: int = 10, username: str = None) -> List[Dict[str, Any]]:
         """Generate mock tweet data for development"""
-        fake = Faker()
-        tweets = []
+        fake = self._fake
+        texts_by_sentiment = self.MOCK_TEXTS
+        now = datetime.now()
         
-        brands = ["Tesla", "Netflix", "Starbucks", "Apple", "Google"]
-        sentiments = ["positive", "negative", "neutral"]
+        # Draw every random column for the whole batch up front
+        rng = np.random.default_rng()
+        brand_col = random.choices(self.MOCK_BRANDS, k=count)
+        sentiment_col = random.choices(self.MOCK_SENTIMENTS, k=count)
+        template_col = random.choices(range(3), k=count)
+        source_col = random.choices(self.MOCK_SOURCES, k=count)
+        tweet_id_col = (rng.choice(900000, size=count, replace=count > 900000) + 100000).tolist()
+        user_id_col = rng.integers(1000, 10000, size=count).tolist()
+        followers_col = rng.integers(100, 1000001, size=count).tolist()
+        following_col = rng.integers(10, 5001, size=count).tolist()
+        retweet_col = rng.integers(0, 1001, size=count).tolist()
+        favorite_col = rng.integers(0, 5001, size=count).tolist()
+        reply_col = rng.integers(0, 101, size=count).tolist()
+        is_retweet_col = (rng.random(count) > 0.7).tolist()
+        hashtag_count_col = rng.integers(0, 4, size=count).tolist()
+        mention_count_col = rng.integers(0, 3, size=count).tolist()
         
-        for i in range(count):
-            brand = random.choice(brands)
-            sentiment = random.choice(sentiments)
-            
-            # Generate appropriate text based on sentiment
-            if sentiment == "positive":
-                texts = [
-                    f"Loving my new {brand} product! Amazing experience!",
-                    f"{brand} is changing the game! So impressed!",
-                    f"Best service from {brand} ever! Highly recommend!"
-                ]
-            elif sentiment == "negative":
-                texts = [
-                    f"Really disappointed with {brand}. Terrible experience.",
-                    f"{brand} customer service is awful. Never again!",
-                    f"Worst purchase ever from {brand}. Stay away!"
-                ]
-            else:
-                texts = [
-                    f"Just bought a {brand} product. We'll see how it goes.",
-                    f"Reading about {brand}'s new features. Interesting.",
-                    f"Saw {brand} mentioned in the news today."
-                ]
-            
-            tweet = {
-                "tweet_id": f"mock_{random.randint(100000, 999999)}",
-                "created_at": fake.date_time_this_month(),
-                "text": random.choice(texts),
-                "user_id": f"user_{random.randint(1000, 9999)}",
-                "user_name": username or fake.user_name(),
-                "user_display_name": fake.name(),
-                "user_followers": random.randint(100, 1000000),
-                "user_following": random.randint(10, 5000),
-                "retweet_count": random.randint(0, 1000),
-                "favorite_count": random.randint(0, 5000),
-                "reply_count": random.randint(0, 100),
-                "is_retweet": random.random() > 0.7,
-                "hashtags": random.sample([brand.lower(), "tech", "review", "customer"], random.randint(0, 3)),
-                "mentions": [f"@{fake.user_name()}" for _ in range(random.randint(0, 2))],
+        created_col = [fake.date_time_this_month() for _ in range(count)]
+        user_name_col = [username] * count if username else [fake.user_name() for _ in range(count)]
+        display_name_col = [fake.name() for _ in range(count)]
+        mention_names = iter([f"@{fake.user_name()}" for _ in range(sum(mention_count_col))])
+        
+        return [
+            {
+                "tweet_id": f"mock_{tweet_id_col[i]}",
+                "created_at": created_col[i],
+                "text": texts_by_sentiment[sentiment_col[i]][template_col[i]].format(brand=brand_col[i]),
+                "user_id": f"user_{user_id_col[i]}",
+                "user_name": user_name_col[i],
+                "user_display_name": display_name_col[i],
+                "user_followers": followers_col[i],
+                "user_following": following_col[i],
+                "retweet_count": retweet_col[i],
+                "favorite_count": favorite_col[i],
+                "reply_count": reply_col[i],
+                "is_retweet": is_retweet_col[i],
+                "hashtags": random.sample(
+                    [brand_col[i].lower(), "tech", "review", "customer"], hashtag_count_col[i]
+                ),
+                "mentions": [next(mention_names) for _ in range(mention_count_col[i])],
                 "urls": [],
                 "language": "en",
-                "source": random.choice(["Twitter Web App", "Twitter for iPhone", "TweetDeck"]),
-                "collected_at": datetime.now(),
-                "brand_mentioned": brand,
-                "sentiment": sentiment
+                "source": source_col[i],
+                "collected_at": now,
+                "brand_mentioned": brand_col[i],
+                "sentiment": sentiment_col[i]
             }
-            
-            tweets.append(tweet)
+            for i in range(count)
+        ]
+    
+    def _get_search_rate_limit(self) -> Dict[str, Any]:
+        """Get the /search/tweets rate limit, reusing it for RATE_LIMIT_TTL seconds"""
+        now = time.monotonic()
+        if self._rate_limit_cache and now - self._rate_limit_cache[0] < self.RATE_LIMIT_TTL:
+            return self._rate_limit_cache[1]
         
-        return tweets
+        # Only request the search family instead of every endpoint's limits
+        status = self.api.rate_limit_status(resources="search")
+        limits = status["resources"]["search"]["/search/tweets"]
+        self._rate_limit_cache = (now, limits)
+        return limits
     
     def test_connection(self) -> bool:
         """Test if API connection works"""
@@ -251,36 +504,142 @@ class TwitterAPIClient:
         
         try:
             # Try to get rate limit status
-            rate_limit_status = self.api.rate_limit_status()
+            search_limits = self._get_search_rate_limit()
             logger.info("Twitter API connection successful")
-            logger.info(f"Rate limits: {rate_limit_status['resources']['search']}")
+            logger.debug("Rate limits: %s", search_limits)
             return True
         except Exception as e:
-            logger.error(f"Twitter API connection failed: {e}")
+            logger.error("Twitter API connection failed: %s", e)
             return False
 
 
+class AsyncTwitterClient:
+    """
+    Run several tweet searches concurrently
+    
+    tweepy's v1.1 API is blocking, so each search runs in a worker thread
+    (asyncio.to_thread) and the searches overlap their network waits, at most
+    max_concurrency at a time. Anything else is delegated to the wrapped
+    TwitterAPIClient.
+    """
+    
+    def __init__(
+        self,
+        client: Optional[TwitterAPIClient] = None,
+        use_mock: bool = False,
+        max_concurrency: int = MAX_CONCURRENT_SEARCHES
+    ):
+        """
+        Args:
+            client: Client to run searches with (created if not given)
+            use_mock: Passed to TwitterAPIClient when creating one
+            max_concurrency: Searches in flight at once
+        """
+        self.client = client or TwitterAPIClient(use_mock=use_mock)
+        self.max_concurrency = max_concurrency
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+    
+    async def search_tweets(self, query: str, count: int = 100, **kwargs) -> List[Dict[str, Any]]:
+        """Search for tweets without blocking the event loop"""
+        return await asyncio.to_thread(self.client.search_tweets, query, count, **kwargs)
+    
+    async def search_many(
+        self,
+        queries: Iterable[str],
+        count: int = 100,
+        **kwargs
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Search for several queries concurrently
+        
+        Args:
+            queries: Search query strings
+            count: Number of tweets to return per query
+            **kwargs: Passed to TwitterAPIClient.search_tweets
+            
+        Returns:
+            Dictionary mapping each query to its tweets
+        """
+        queries = list(queries)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def search(query):
+            async with semaphore:
+                return await self.search_tweets(query, count, **kwargs)
+        
+        results = await asyncio.gather(*map(search, queries))
+        return dict(zip(queries, results))
+    
+    def search_tweets_many(
+        self,
+        queries: Iterable[str],
+        count: int = 100,
+        **kwargs
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Blocking wrapper around search_many for code without an event loop"""
+        return asyncio.run(self.search_many(queries, count, **kwargs))
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback encoder for values the stdlib json module can't handle"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def serialize_tweets(tweets: Iterable[Dict[str, Any]], indent: bool = False) -> bytes:
+    """
+    Serialize tweet dictionaries to UTF-8 JSON
+    
+    Args:
+        tweets: Tweet dictionaries (datetimes are written as ISO 8601)
+        indent: Pretty-print with two-space indentation
+        
+    Returns:
+        JSON array as bytes
+    """
+    tweets = list(tweets)
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(tweets, option=option)
+    return json.dumps(tweets, default=_json_default,
+                      indent=2 if indent else None).encode("utf-8")
+
+
 # ============================================================================
 # SINGLE get_twitter_client FUNCTION - This is the only one that should exist
 # ============================================================================
 
-def get_twitter_client(use_mock: bool = True) -> TwitterAPIClient:
+def get_twitter_client(
+    use_mock: bool = True,
+    async_: bool = False
+) -> Union[TwitterAPIClient, AsyncTwitterClient]:
     """
     Factory function to get Twitter API client
     
     Args:
         use_mock: If True, returns client with mock data
                   If False, attempts to use real Twitter API
+        async_: If True, wrap the client in an AsyncTwitterClient for
+                concurrent searches
         
     Returns:
-        TwitterAPIClient instance (always returns a client, never None)
+        TwitterAPIClient (or AsyncTwitterClient) instance
+        (always returns a client, never None)
     """
     try:
-        return TwitterAPIClient(use_mock=use_mock)
+        client = TwitterAPIClient(use_mock=use_mock)
     except Exception as e:
-        logger.error(f"Error creating Twitter client: {e}")
+        logger.error("Error creating Twitter client: %s", e)
         logger.info("Falling back to mock client")
-        return TwitterAPIClient(use_mock=True)
+        client = TwitterAPIClient(use_mock=True)
+    return AsyncTwitterClient(client) if async_ else client
 
 
 # ============================================================================
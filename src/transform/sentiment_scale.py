@@ -0,0 +1,8 @@
+"""
+Sentiment score quantization shared by the analyzer and the database loader
+Kept free of NLP dependencies so the loader can import it without TextBlob
+"""
+
+# Polarity in [-1, 1] is also stored as round(polarity * SCORE_I8_SCALE),
+# which fits in a signed byte
+SCORE_I8_SCALE = 127
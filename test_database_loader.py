@@ -8,9 +8,6 @@ import os
 import pandas as pd
 from datetime import datetime
 
-# Add src to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 print("?? Testing Database Loader")
 print("=" * 50)
 
@@ -169,6 +166,33 @@ try:
 except Exception as e:
     print(f"? Error with utility function: {e}")
 
+# Step 8b: Test the background writer
+print("\n8b. Testing background writer (save_tweets_async / flush)...")
+try:
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        async_loader = DatabaseLoader(db_type='sqlite', db_path=os.path.join(tmp_dir, 'async.db'))
+        good_batch = [dict(test_tweets[0], tweet_id=f'async_{i:03d}') for i in range(49)]
+        bad_batch = [dict(test_tweets[1], tweet_id='async_bad', user_id=None)]
+        
+        async_loader.save_tweets_async(good_batch)
+        async_loader.save_tweets_async(bad_batch)
+        try:
+            async_loader.flush()
+            print("? flush() did not report the failed batch")
+        except Exception as e:
+            print(f"? flush() reported the failed batch: {e}")
+        
+        stored = len(async_loader.get_recent_tweets(limit=100))
+        if stored == len(good_batch):
+            print(f"? Background writer kept the good batch ({stored} tweets)")
+        else:
+            print(f"? Expected {len(good_batch)} tweets from the good batch, found {stored}")
+        async_loader.close()
+except Exception as e:
+    print(f"? Error with background writer: {e}")
+
 # Step 9: Database info
 print("\n9. Database information:")
 try:
@@ -201,6 +225,7 @@ print("   - Saving tweets to SQLite")
 print("   - Retrieving tweets with pagination")
 print("   - Brand mention tracking")
 print("   - Daily statistics generation")
+print("   - Background writer batch isolation")
 print("   - Utility functions")
 
 print("\n?? Next steps for your Twitter Data Engineering project:")
@@ -6,19 +6,16 @@ FIXED VERSION - Handles None client and import issues
 
 import sys
 import os
+import tempfile
 import traceback
 
-# FIX 1: Add proper Python paths
-current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, current_dir)  # Add project root
-sys.path.insert(0, os.path.join(current_dir, "src"))  # Add src folder
-
 def main():
     print("🚀 Testing Integrated Pipeline - FIXED VERSION")
     print("=" * 50)
     
     try:
-        # FIX 2: Import with error handling
+        # FIX 2: Import with error handling (needs `pip install -e .`, or
+        # running from the project root)
         print("\n1. Importing modules...")
         try:
             from src.extract.twitter_api_client import get_twitter_client
@@ -27,17 +24,8 @@ def main():
             print("✅ All modules imported successfully")
         except ImportError as e:
             print(f"❌ Import error: {e}")
-            print("Trying alternative imports...")
-            
-            # Try without src prefix
-            try:
-                from extract.twitter_api_client import get_twitter_client
-                from transform.sentiment_analyzer import SentimentAnalyzer
-                from load.database_loader import DatabaseLoader
-                print("✅ Imported without 'src' prefix")
-            except ImportError as e2:
-                print(f"❌ All imports failed: {e2}")
-                return
+            print("Install the project first: pip install -e .")
+            return
         
         print("\n2. Getting Twitter client...")
         # FIX 3: Handle None client
@@ -49,29 +37,31 @@ def main():
             
             # Create a simple mock client
             class SimpleMockClient:
+                # Fields shared by every mock tweet; built once, not per tweet
+                TEMPLATE = {
+                    "created_at": "2024-01-15T10:30:00",
+                    "user_id": "user_1",
+                    "user_name": "@test_user",
+                    "user_display_name": "Test User",
+                    "user_followers": 100,
+                    "user_following": 50,
+                    "retweet_count": 5,
+                    "favorite_count": 10,
+                    "reply_count": 2,
+                    "is_retweet": False,
+                    "language": "en",
+                    "source": "Mock",
+                    "hashtags": ["test"],
+                    "mentions": [],
+                    "brand_mentioned": "TestBrand"
+                }
+                
                 def search_tweets(self, query, count=10):
                     print(f"  Mock search for: '{query}'")
                     # Return simple mock data
+                    base = {**self.TEMPLATE, "text": f"Mock tweet about {query}"}
                     return [
-                        {
-                            "tweet_id": "mock_1",
-                            "text": f"Mock tweet about {query}",
-                            "created_at": "2024-01-15T10:30:00",
-                            "user_id": "user_1",
-                            "user_name": "@test_user",
-                            "user_display_name": "Test User",
-                            "user_followers": 100,
-                            "user_following": 50,
-                            "retweet_count": 5,
-                            "favorite_count": 10,
-                            "reply_count": 2,
-                            "is_retweet": False,
-                            "language": "en",
-                            "source": "Mock",
-                            "hashtags": ["test"],
-                            "mentions": [],
-                            "brand_mentioned": "TestBrand"
-                        }
+                        {**base, "tweet_id": f"mock_{i + 1}"}
                         for i in range(min(count, 5))
                     ]
             
@@ -151,25 +141,38 @@ def main():
         
         print("\n5. Loading to database...")
         try:
-            db_loader = DatabaseLoader(db_type='sqlite', db_path='data/database/twitter.db')
-            saved_count = db_loader.save_tweets(analyzed_tweets)
-            print(f"✅ Saved {saved_count} tweets to database")
-            
-            print("\n6. Verifying data...")
-            db_tweets = db_loader.get_recent_tweets(limit=5)
+            # Scratch database in a temp dir, so the real data/database/twitter.db
+            # is never touched and needs no fsync on every commit. One loader
+            # (and connection) serves both the save and the verification
+            with tempfile.TemporaryDirectory() as tmp_dir, \
+                    DatabaseLoader(db_type='sqlite',
+                                   db_path=os.path.join(tmp_dir, 'pipeline.db'),
+                                   pragmas={'synchronous': 'OFF'}) as db_loader:
+                saved_count = db_loader.save_tweets(analyzed_tweets)
+                print(f"✅ Saved {saved_count} tweets to database")
+
+                # Stream a larger search straight into the same scratch
+                # database when the client supports it: tweets are analyzed
+                # and saved in batches, and vanish with the temp dir
+                if hasattr(client, 'search_tweets_iter'):
+                    stream = analyzer.analyze_tweets_iter(
+                        client.search_tweets_iter("technology", count=100)
+                    )
+                    streamed_count = db_loader.save_tweets(stream)
+                    print(f"✅ Streamed {streamed_count} more tweets to database")
+
+                print("\n6. Verifying data...")
+                db_tweets = db_loader.get_recent_tweets(limit=5, columns=['content', 'sentiment_category'])
             
-            if not db_tweets.empty:
-                print(f"✅ Retrieved {len(db_tweets)} tweets from database")
+                if not db_tweets.empty:
+                    print(f"✅ Retrieved {len(db_tweets)} tweets from database")
                 
-                # Show sample
-                print("\n📊 Sample from database:")
-                for i, (_, row) in enumerate(db_tweets.iterrows()):
-                    if i < 3:  # Show first 3
-                        text_preview = row.get('content', row.get('text', ''))[:50]
-                        sentiment = row.get('sentiment_category', 'unknown')
-                        print(f"   [{i+1}] {sentiment}: '{text_preview}...'")
-            
-            db_loader.close()
+                    # Show sample
+                    print("\n📊 Sample from database:")
+                    for i, row in enumerate(db_tweets.head(3).itertuples(index=False), 1):
+                        text_preview = getattr(row, 'content', getattr(row, 'text', ''))[:50]
+                        sentiment = getattr(row, 'sentiment_category', 'unknown')
+                        print(f"   [{i}] {sentiment}: '{text_preview}...'")
             
         except Exception as e:
             print(f"❌ Database error: {e}")
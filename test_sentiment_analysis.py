@@ -3,13 +3,8 @@
 Test script for Sentiment Analysis Module
 """
 
-import sys
-import os
 import logging
 
-# Add src to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.transform.sentiment_analyzer import (
     SentimentAnalyzer, 
     analyze_tweet_sentiment, 
@@ -6,19 +6,26 @@ Test script for Twitter API client - Updated with better error handling
 
 import sys
 import os
-
-# Add src to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv
+from collections import defaultdict
 
 try:
-    from src.extract.twitter_api_client import get_twitter_client
+    from src.extract.twitter_api_client import get_twitter_client, serialize_tweets
     import pandas as pd
-    import json
 except ImportError as e:
     print(f"❌ Missing dependency: {e}")
     print("Please run: pip install pandas faker")
     sys.exit(1)
 
+def walk_files(path):
+    """Yield (path, size) for every file under path, one scandir per directory"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                yield entry.path, entry.stat().st_size
+            elif entry.is_dir():
+                yield from walk_files(entry.path)
+
 def main():
     print("🚀 Testing Twitter Data Intelligence Setup")
     print("=" * 50)
@@ -53,6 +60,13 @@ def main():
         print(f"   Created: {sample['created_at']}")
         print(f"   Retweets: {sample['retweet_count']}")
     
+    # Optional: several queries at once through the async client
+    print("\n3b. Searching several queries concurrently...")
+    async_client = get_twitter_client(use_mock=True, async_=True)
+    results = async_client.search_tweets_many(["data engineering", "airflow", "python"], count=5)
+    for query, found in results.items():
+        print(f"   {query}: {len(found)} tweets")
+    
     # Test 4: Convert to DataFrame
     print("\n4. Converting to DataFrame...")
     df = pd.DataFrame(tweets)
@@ -70,40 +84,53 @@ def main():
     
     # Save raw data - try different formats
     try:
-        # Try Parquet first
-        df.to_parquet("data/raw/test_tweets.parquet")
+        # Try Parquet first, building the Arrow table straight from the dicts
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        pq.write_table(pa.Table.from_pylist(tweets), "data/raw/test_tweets.parquet")
         print("✅ Saved as Parquet: data/raw/test_tweets.parquet")
     except ImportError:
         print("⚠️  PyArrow not installed, skipping Parquet...")
     except Exception as e:
         print(f"⚠️  Could not save as Parquet: {e}")
     
-    # Always save as CSV (no dependencies needed)
-    df.to_csv("data/raw/test_tweets.csv", index=False)
+    # Always save as CSV (no dependencies needed), straight from the dicts
+    fieldnames = list(dict.fromkeys(key for tweet in tweets for key in tweet))
+    with open("data/raw/test_tweets.csv", "w", newline="", encoding="utf-8",
+              buffering=1 << 20) as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(tweets)
     print("✅ Saved as CSV: data/raw/test_tweets.csv")
     
-    # Save as JSON
-    df.to_json("data/raw/test_tweets.json", orient="records", indent=2)
+    # Save as JSON straight from the dicts (orjson when installed)
+    with open("data/raw/test_tweets.json", "wb") as f:
+        f.write(serialize_tweets(tweets, indent=True))
     print("✅ Saved as JSON: data/raw/test_tweets.json")
     
-    # Save processed (just a sample transformation)
-    if 'brand_mentioned' in df.columns:
-        brand_summary = df.groupby('brand_mentioned').agg({
-            'tweet_id': 'count',
-            'retweet_count': 'mean',
-            'favorite_count': 'mean'
-        }).round(2)
-        
-        brand_summary.to_csv("data/processed/brand_summary.csv")
+    # Save processed (just a sample transformation): tweet count and mean
+    # retweets/favorites per brand, accumulated in one pass over the dicts
+    brand_totals = defaultdict(lambda: [0, 0, 0])
+    for tweet in tweets:
+        brand = tweet.get('brand_mentioned')
+        if brand is not None:
+            totals = brand_totals[brand]
+            totals[0] += 1
+            totals[1] += tweet['retweet_count']
+            totals[2] += tweet['favorite_count']
+    
+    if brand_totals:
+        with open("data/processed/brand_summary.csv", "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(['brand_mentioned', 'tweet_id', 'retweet_count', 'favorite_count'])
+            for brand, (count, retweets, favorites) in sorted(brand_totals.items()):
+                writer.writerow([brand, count, round(retweets / count, 2), round(favorites / count, 2)])
         print("✅ Created brand summary in data/processed/brand_summary.csv")
     
     # Show file sizes
     print("\n📁 File sizes:")
-    import glob
-    for file in glob.glob("data/**/*", recursive=True):
-        if os.path.isfile(file):
-            size_kb = os.path.getsize(file) / 1024
-            print(f"   {file}: {size_kb:.1f} KB")
+    for file, size in walk_files("data"):
+        print(f"   {file}: {size / 1024:.1f} KB")
     
     print("\n" + "=" * 50)
     print("🎉 All tests completed successfully!")